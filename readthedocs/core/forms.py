@@ -16,6 +16,15 @@ log = structlog.get_logger(__name__)
 
 
 class UserProfileForm(forms.ModelForm):
+
+    """
+    Edit the user profile, and the name of its user.
+
+    The instance should have its ``user`` already loaded (e.g. using
+    ``request.user.profile`` or ``select_related("user")``) to avoid an extra
+    query when accessing it.
+    """
+
     first_name = CharField(label=_("First name"), required=False, max_length=30)
     last_name = CharField(label=_("Last name"), required=False, max_length=30)
 
@@ -65,7 +74,7 @@ class UserProfileForm(forms.ModelForm):
             # SimpleHistoryModelForm isn't used here
             # because the model of this form is `UserProfile`, not `User`.
             set_change_reason(user, self.get_change_reason())
-            user.save()
+            user.save(update_fields=["first_name", "last_name"])
         return profile
 
     def get_change_reason(self):
@@ -113,6 +122,4 @@ class FacetField(forms.MultipleChoiceField):
         Instead, we just validate that the value is in the correct format for
         facet filtering (facet_name:value)
         """
-        if ":" not in value:
-            return False
-        return True
+        return ":" in value
@@ -1,5 +1,7 @@
 """Integration admin models."""
 
+from functools import lru_cache
+
 from django import urls
 from django.contrib import admin
 from django.utils.safestring import mark_safe
@@ -8,6 +10,13 @@ from pygments.formatters import HtmlFormatter
 from .models import HttpExchange, Integration
 
 
+@lru_cache(maxsize=1)
+def get_pretty_json_styles():
+    """Return the Pygments stylesheet, it's the same for every object."""
+    formatter = HtmlFormatter(style="colorful")
+    return "<style>" + formatter.get_style_defs() + "</style>"
+
+
 def pretty_json_field(field, description, include_styles=False):
     # There is some styling here because this is easier than reworking how the
     # admin is getting stylesheets. We only need minimal styles here, and there
@@ -15,8 +24,7 @@ def pretty_json_field(field, description, include_styles=False):
     def inner(_, obj):
         styles = ""
         if include_styles:
-            formatter = HtmlFormatter(style="colorful")
-            styles = "<style>" + formatter.get_style_defs() + "</style>"
+            styles = get_pretty_json_styles()
         return mark_safe(
             '<div style="{}">{}</div>{}'.format(
                 "float: left;",
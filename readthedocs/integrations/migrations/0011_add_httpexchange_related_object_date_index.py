@@ -0,0 +1,19 @@
+# Generated by Django 4.2.5 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("integrations", "0010_remove_old_jsonfields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="httpexchange",
+            index=models.Index(
+                fields=["content_type", "object_id", "-date"],
+                name="integration_content_71e196_idx",
+            ),
+        ),
+    ]
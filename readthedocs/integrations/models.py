@@ -1,9 +1,10 @@
 """Integration models for external services."""
 
 import json
-import re
 import uuid
+from functools import cached_property, lru_cache
 
+import orjson
 from django.contrib.contenttypes.fields import (
     GenericForeignKey,
     GenericRelation,
@@ -23,15 +24,18 @@ from readthedocs.projects.models import Project
 from .utils import get_secret, normalize_request_payload
 
 
+# Pygments lexer and formatter don't keep state between calls, share them
+_JSON_LEXER = JsonLexer()
+_HTML_FORMATTER = HtmlFormatter()
+
+
 class HttpExchangeManager(models.Manager):
 
     """HTTP exchange manager methods."""
 
-    # Filter rules for request headers to remove from the output
-    REQ_FILTER_RULES = [
-        re.compile("^X-Forwarded-.*$", re.I),
-        re.compile("^X-Real-Ip$", re.I),
-    ]
+    # Request headers to remove from the output, as raw WSGI header names
+    REQ_FILTER_HEADERS = frozenset(["HTTP_X_REAL_IP"])
+    REQ_FILTER_PREFIX = "HTTP_X_FORWARDED_"
 
     @transaction.atomic
     def from_exchange(self, req, resp, related_object, payload=None):
@@ -53,33 +57,24 @@ class HttpExchangeManager(models.Manager):
         request_payload = payload
         if request_payload is None:
             request_payload = normalize_request_payload(req)
-        try:
-            request_body = json.dumps(request_payload, sort_keys=True)
-        except TypeError:
-            request_body = str(request_payload)
+        request_body = self.dumps_payload(request_payload)
         # This is the rawest form of request header we have, the WSGI
         # headers. HTTP headers are prefixed with `HTTP_`, which we remove,
         # and because the keys are all uppercase, we'll normalize them to
-        # title case-y hyphen separated values.
+        # title case-y hyphen separated values. Unwanted headers are skipped
+        # before normalizing them.
         request_headers = {
             key[5:].title().replace("_", "-"): str(val)
-            for (key, val) in list(req.META.items())
+            for (key, val) in req.META.items()
             if key.startswith("HTTP_")
+            and key not in self.REQ_FILTER_HEADERS
+            and not key.startswith(self.REQ_FILTER_PREFIX)
         }  # yapf: disable
-
         request_headers["Content-Type"] = req.content_type
-        # Remove unwanted headers
-        for filter_rule in self.REQ_FILTER_RULES:
-            for key in list(request_headers.keys()):
-                if filter_rule.match(key):
-                    del request_headers[key]
 
         response_payload = resp.data if hasattr(resp, "data") else resp.content
-        try:
-            response_body = json.dumps(response_payload, sort_keys=True)
-        except TypeError:
-            response_body = str(response_payload)
-        response_headers = dict(list(resp.items()))
+        response_body = self.dumps_payload(response_payload)
+        response_headers = dict(resp.items())
 
         fields = {
             "status_code": resp.status_code,
@@ -93,6 +88,28 @@ class HttpExchangeManager(models.Manager):
         self.delete_limit(related_object)
         return obj
 
+    def dumps_payload(self, payload):
+        """
+        Serialize ``payload`` to JSON, or to a string if it isn't serializable.
+
+        orjson serializes dict subclasses from their underlying storage, so
+        mappings like ``QueryDict`` are normalized first to keep the last
+        value of each key, as ``items()`` returns them.
+
+        orjson doesn't support some values the stdlib does (e.g. integers
+        above 64 bits or non-str keys), those fall back to ``json``.
+        """
+        if isinstance(payload, dict) and type(payload) is not dict:
+            payload = dict(payload.items())
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass
+        try:
+            return json.dumps(payload, sort_keys=True)
+        except TypeError:
+            return str(payload)
+
     def from_requests_exchange(self, response, related_object):
         """
         Create an exchange object from a requests' response.
@@ -106,7 +123,7 @@ class HttpExchangeManager(models.Manager):
         # not JSON serializable.
         obj = self.create(
             related_object=related_object,
-            request_headers=dict(request.headers) or {},
+            request_headers=dict(request.headers),
             request_body=request.body or "",
             status_code=response.status_code,
             response_headers=dict(response.headers),
@@ -116,22 +133,24 @@ class HttpExchangeManager(models.Manager):
         return obj
 
     def delete_limit(self, related_object, limit=10):
-        # If the related_object is an instance of Integration,
-        # it could be a proxy model, so we force it to always be the "real" model.
-        if isinstance(related_object, Integration):
-            model = Integration
-        else:
-            model = related_object
-
+        # The related_object could be a proxy model (e.g. an Integration
+        # subclass), ``get_for_model`` resolves it to the "real" model.
+        # The content type is cached, so this doesn't hit the database.
         queryset = self.filter(
-            content_type=ContentType.objects.get(
-                app_label=model._meta.app_label,
-                model=model._meta.model_name,
-            ),
+            content_type=ContentType.objects.get_for_model(related_object),
             object_id=related_object.pk,
         )
-        for exchange in queryset[limit:]:
-            exchange.delete()
+        # Fetch only the dates of the most recent exchanges to keep, instead of
+        # scanning past them to find the ones to delete. Deleting by a date
+        # cutoff never removes exchanges created concurrently after this read.
+        # Exchanges sharing the cutoff date are all kept, so at least (not
+        # exactly) ``limit`` exchanges remain. This is intended, excluding the
+        # kept ids instead could delete newer concurrent exchanges.
+        dates_to_keep = list(
+            queryset.order_by("-date").values_list("date", flat=True)[:limit]
+        )
+        if len(dates_to_keep) == limit:
+            queryset.filter(date__lt=dates_to_keep[-1]).delete()
 
 
 class HttpExchange(models.Model):
@@ -171,6 +190,9 @@ class HttpExchange(models.Model):
 
     class Meta:
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["content_type", "object_id", "-date"]),
+        ]
 
     def __str__(self):
         return _("Exchange {0}").format(self.pk)
@@ -185,19 +207,24 @@ class HttpExchange(models.Model):
         value = getattr(self, field) or ""
         try:
             if not isinstance(value, dict):
+                # Parse with the stdlib, orjson turns large integers into floats
                 value = json.loads(value)
-            json_value = json.dumps(value, sort_keys=True, indent=2)
-            formatter = HtmlFormatter()
-            html = highlight(json_value, JsonLexer(), formatter)
+            try:
+                json_value = orjson.dumps(
+                    value, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                ).decode()
+            except TypeError:
+                json_value = json.dumps(value, sort_keys=True, indent=2)
+            html = highlight(json_value, _JSON_LEXER, _HTML_FORMATTER)
             return mark_safe(html)
         except (ValueError, TypeError):
             return value
 
-    @property
+    @cached_property
     def formatted_request_body(self):
         return self.formatted_json("request_body")
 
-    @property
+    @cached_property
     def formatted_response_body(self):
         return self.formatted_json("response_body")
 
@@ -212,14 +239,23 @@ class IntegrationQuerySet(models.QuerySet):
         This doesn't affect queries currently, only fetching of an object
     """
 
-    def _get_subclass(self, integration_type):
-        # Build a mapping of integration_type -> class dynamically
-        class_map = {
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_class_map(model):
+        """
+        Build a mapping of integration_type -> class for ``model``.
+
+        Subclasses are defined at import time, so the mapping is cached for
+        the life of the process.
+        """
+        return {
             cls.integration_type_id: cls
-            for cls in self.model.__subclasses__()
+            for cls in model.__subclasses__()
             if hasattr(cls, "integration_type_id")
         }  # yapf: disable
-        return class_map.get(integration_type)
+
+    def _get_subclass(self, integration_type):
+        return self._get_class_map(self.model).get(integration_type)
 
     def _get_subclass_replacement(self, original):
         """
@@ -228,14 +264,14 @@ class IntegrationQuerySet(models.QuerySet):
         This is based on the ``integration_type`` field, and is used to provide
         specific functionality to and integration via a proxy subclass of the
         Integration model.
+
+        Subclasses are proxy models sharing the same fields, so the instance
+        class is swapped in place instead of copying its attributes over.
         """
         cls_replace = self._get_subclass(original.integration_type)
-        if cls_replace is None:
-            return original
-        new = cls_replace()
-        for k, v in list(original.__dict__.items()):
-            new.__dict__[k] = v
-        return new
+        if cls_replace is not None:
+            original.__class__ = cls_replace
+        return original
 
     def get(self, *args, **kwargs):
         original = super().get(*args, **kwargs)
@@ -334,9 +370,10 @@ class GitHubWebhook(Integration):
 
     @property
     def can_sync(self):
+        provider_data = self.provider_data
         try:
-            return all((k in self.provider_data) for k in ["id", "url"])
-        except (ValueError, TypeError):
+            return "id" in provider_data and "url" in provider_data
+        except TypeError:
             return False
 
 
@@ -349,9 +386,10 @@ class BitbucketWebhook(Integration):
 
     @property
     def can_sync(self):
+        provider_data = self.provider_data
         try:
-            return all((k in self.provider_data) for k in ["uuid", "url"])
-        except (ValueError, TypeError):
+            return "uuid" in provider_data and "url" in provider_data
+        except TypeError:
             return False
 
 
@@ -364,9 +402,10 @@ class GitLabWebhook(Integration):
 
     @property
     def can_sync(self):
+        provider_data = self.provider_data
         try:
-            return all((k in self.provider_data) for k in ["id", "url"])
-        except (ValueError, TypeError):
+            return "id" in provider_data and "url" in provider_data
+        except TypeError:
             return False
 
 
@@ -387,6 +426,11 @@ class GenericAPIWebhook(Integration):
             if token is None:
                 token = default_token()
                 self.provider_data = {"token": token}
+                # Make sure the new token is stored on narrow updates,
+                # an empty ``update_fields`` is still a no-op.
+                update_fields = kwargs.get("update_fields")
+                if update_fields and "provider_data" not in update_fields:
+                    kwargs["update_fields"] = [*update_fields, "provider_data"]
         super().save(*args, **kwargs)
 
     @property
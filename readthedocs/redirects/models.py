@@ -33,6 +33,9 @@ TYPE_CHOICES = (
     # ('advanced', _('Advanced')),
 )
 
+# Redirect types that are displayed with their from/to URLs
+FROM_TO_URL_TYPES = frozenset(["prefix", "page", "exact"])
+
 # FIXME: this help_text message should be dynamic since "Absolute path" doesn't
 # make sense for "Prefix Redirects" since the from URL is considered after the
 # ``/$lang/$version/`` part. Also, there is a feature for the "Exact
@@ -46,6 +49,9 @@ to_url_helptext = _(
 )
 redirect_type_helptext = _("The type of redirect you wish to use.")
 
+# Pattern used on each redirect, compiled once at import time
+HTTP_SCHEME_RE = re.compile(r"^https?://")
+
 
 class Redirect(models.Model):
 
@@ -109,6 +115,17 @@ class Redirect(models.Model):
 
     objects = RedirectQuerySet.as_manager()
 
+    # Mapping of redirect_type -> name of the method handling it. Methods are
+    # resolved by name, so subclass overrides and mocks are respected. An
+    # unknown redirect_type raises ``KeyError``.
+    REDIRECT_METHODS = {
+        "prefix": "redirect_prefix",
+        "page": "redirect_page",
+        "exact": "redirect_exact",
+        "sphinx_html": "redirect_sphinx_html",
+        "sphinx_htmldir": "redirect_sphinx_htmldir",
+    }
+
     class Meta:
         verbose_name = _("redirect")
         verbose_name_plural = _("redirects")
@@ -120,11 +137,10 @@ class Redirect(models.Model):
         super().save(*args, **kwargs)
 
     def __str__(self):
-        redirect_text = "{type}: {from_to_url}"
-        if self.redirect_type in ["prefix", "page", "exact"]:
-            return redirect_text.format(
-                type=self.get_redirect_type_display(),
-                from_to_url=self.get_from_to_url_display(),
+        if self.redirect_type in FROM_TO_URL_TYPES:
+            return (
+                f"{self.get_redirect_type_display()}: "
+                f"{self.get_from_to_url_display()}"
             )
         return gettext(
             "Redirect: {}".format(
@@ -133,18 +149,12 @@ class Redirect(models.Model):
         )
 
     def get_from_to_url_display(self):
-        if self.redirect_type in ["prefix", "page", "exact"]:
+        if self.redirect_type in FROM_TO_URL_TYPES:
             from_url = self.from_url
             to_url = self.to_url
             if self.redirect_type == "prefix":
-                to_url = "/{lang}/{version}/".format(
-                    lang=self.project.language,
-                    version=self.project.default_version,
-                )
-            return "{from_url} -> {to_url}".format(
-                from_url=from_url,
-                to_url=to_url,
-            )
+                to_url = f"/{self.project.language}/{self.project.default_version}/"
+            return f"{from_url} -> {to_url}"
         return ""
 
     def get_full_path(
@@ -157,7 +167,7 @@ class Redirect(models.Model):
         is returned.
         """
         # Handle explicit http redirects
-        if allow_crossdomain and re.match("^https?://", filename):
+        if allow_crossdomain and HTTP_SCHEME_RE.match(filename):
             return filename
 
         return resolve_path(
@@ -168,14 +178,12 @@ class Redirect(models.Model):
         )
 
     def get_redirect_path(self, path, full_path=None, language=None, version_slug=None):
-        method = getattr(
-            self,
-            "redirect_{type}".format(
-                type=self.redirect_type,
-            ),
-        )
+        method = getattr(self, self.REDIRECT_METHODS[self.redirect_type])
         return method(
-            path, full_path=full_path, language=language, version_slug=version_slug
+            path,
+            full_path=full_path,
+            language=language,
+            version_slug=version_slug,
         )
 
     def redirect_prefix(self, path, full_path, language=None, version_slug=None):
@@ -215,11 +223,14 @@ class Redirect(models.Model):
                 return cut_path
 
     def redirect_sphinx_html(self, path, full_path, language=None, version_slug=None):
-        for ending in ["/", "/index.html"]:
+        # Check the longest suffix first
+        for ending in ["/index.html", "/"]:
             if path.endswith(ending):
                 log.debug("Redirecting...", redirect=self)
-                path = path[1:]  # Strip leading slash.
-                to = re.sub(ending + "$", ".html", path)
+                to = path[1:]  # Strip leading slash.
+                # The ending may overlap the stripped slash (e.g. ``/``).
+                if to.endswith(ending):
+                    to = to[: -len(ending)] + ".html"
                 return self.get_full_path(
                     filename=to,
                     language=language,
@@ -232,8 +243,9 @@ class Redirect(models.Model):
     ):
         if path.endswith(".html"):
             log.debug("Redirecting...", redirect=self)
-            path = path[1:]  # Strip leading slash.
-            to = re.sub(".html$", "/", path)
+            to = path[1:]  # Strip leading slash.
+            if to.endswith(".html"):
+                to = to[: -len(".html")] + "/"
             return self.get_full_path(
                 filename=to,
                 language=language,
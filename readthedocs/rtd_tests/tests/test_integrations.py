@@ -3,6 +3,7 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 
 from readthedocs.integrations.models import (
+    GenericAPIWebhook,
     GitHubWebhook,
     HttpExchange,
     Integration,
@@ -38,7 +39,7 @@ class HttpExchangeTests(TestCase):
         exchange = HttpExchange.objects.get(integrations=integration)
         self.assertEqual(
             exchange.request_body,
-            '{"ref": "exchange_json"}',
+            '{"ref":"exchange_json"}',
         )
         self.assertEqual(
             exchange.request_headers,
@@ -50,7 +51,7 @@ class HttpExchangeTests(TestCase):
         self.assertEqual(
             exchange.response_body,
             (
-                '{{"build_triggered": false, "project": "{0}", "versions": []}}'.format(
+                '{{"build_triggered":false,"project":"{0}","versions":[]}}'.format(
                     project.slug
                 )
             ),
@@ -82,7 +83,7 @@ class HttpExchangeTests(TestCase):
         exchange = HttpExchange.objects.get(integrations=integration)
         self.assertEqual(
             exchange.request_body,
-            '{"ref": "exchange_form"}',
+            '{"ref":"exchange_form"}',
         )
         self.assertEqual(
             exchange.request_headers,
@@ -94,7 +95,7 @@ class HttpExchangeTests(TestCase):
         self.assertEqual(
             exchange.response_body,
             (
-                '{{"build_triggered": false, "project": "{0}", "versions": []}}'.format(
+                '{{"build_triggered":false,"project":"{0}","versions":[]}}'.format(
                     project.slug
                 )
             ),
@@ -107,6 +108,27 @@ class HttpExchangeTests(TestCase):
             },
         )
 
+    def test_exchange_form_request_body_multiple_values(self):
+        client = APIClient()
+        project = fixture.get(Project, main_language_project=None)
+        integration = Integration.objects.create(
+            project=project,
+            integration_type=Integration.API_WEBHOOK,
+        )
+        resp = client.post(
+            "/api/v2/webhook/{}/{}/".format(project.slug, integration.pk),
+            "token={}&branches=nonexistent-a&branches=nonexistent-b".format(
+                integration.token
+            ),
+            content_type="application/x-www-form-urlencoded",
+        )
+        self.assertEqual(resp.status_code, 200)
+        exchange = HttpExchange.objects.get(integrations=integration)
+        self.assertEqual(
+            exchange.request_body,
+            '{{"branches":"nonexistent-b","token":"{0}"}}'.format(integration.token),
+        )
+
     def test_extraneous_exchanges_deleted_in_correct_order(self):
         client = APIClient()
         client.login(username="super", password="test")
@@ -143,7 +165,7 @@ class HttpExchangeTests(TestCase):
         self.assertEqual(
             HttpExchange.objects.filter(
                 integrations=integration,
-                request_body='{"ref": "preserved"}',
+                request_body='{"ref":"preserved"}',
             ).count(),
             10,
         )
@@ -211,3 +233,19 @@ class IntegrationModelTests(TestCase):
             project=project,
         )
         self.assertIsNotNone(integration.token)
+
+    def test_generic_token_saved_on_narrow_update(self):
+        project = fixture.get(Project, main_language_project=None)
+        integration = Integration.objects.create(
+            integration_type=Integration.API_WEBHOOK,
+            project=project,
+        )
+        Integration.objects.filter(pk=integration.pk).update(provider_data={})
+        integration = Integration.objects.get(pk=integration.pk)
+        self.assertIsInstance(integration, GenericAPIWebhook)
+        integration.recreate_secret()
+        self.assertIsNotNone(integration.token)
+
+        token = integration.token
+        integration = Integration.objects.get(pk=integration.pk)
+        self.assertEqual(integration.token, token)